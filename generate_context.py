@@ -1,5 +1,7 @@
 import os
 import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Files and directories to ignore
 IGNORE_PATTERNS = [
@@ -20,8 +22,6 @@ IGNORE_PATTERNS = [
     '*.dylib',
     '*.log',
     '*.pot',
-    '*.pyc',
-    '*.pyo',
     '*.sln',
     '*.user',
     '*.suo',
@@ -32,64 +32,119 @@ IGNORE_PATTERNS = [
     'build'
 ]
 
+# Split once at import: exact names go in a set, '*' globs become a suffix tuple
+_IGNORED_NAMES = frozenset(p for p in IGNORE_PATTERNS if not p.startswith('*'))
+_IGNORED_SUFFIXES = tuple(p[1:] for p in IGNORE_PATTERNS if p.startswith('*'))
+
+# Number of file reads kept in flight ahead of the writer
+READ_AHEAD = 16
+
+# Pre-encoded separators written around each file's raw bytes
+_HEADER_RULE = b"-" * 80 + b"\n"
+_FOOTER = b"\n\n" + b"=" * 80 + b"\n\n"
+
 def should_ignore(path):
-    """Check if a path should be ignored based on patterns."""
-    path_parts = path.split(os.sep)
-    for pattern in IGNORE_PATTERNS:
-        if pattern.startswith('*'):
-            if any(part.endswith(pattern[1:]) for part in path_parts):
-                return True
-        elif pattern in path_parts:
-            return True
-    return False
+    """Check if a path should be ignored based on its final component."""
+    name = os.path.basename(path)
+    return name in _IGNORED_NAMES or name.endswith(_IGNORED_SUFFIXES)
+
+def read_utf8(file_path):
+    """Read a UTF-8 text file as raw bytes, returning None if it looks binary."""
+    with open(file_path, 'rb') as f:
+        head = f.read(4096)
+        # A null byte in the first block is the classic binary heuristic
+        if b'\x00' in head:
+            return None
+        data = head + f.read()
+    try:
+        # Validate only; the bytes are written through without re-encoding
+        data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # Undecodable bytes in the probe block mean binary; later ones are errors
+        if e.start < len(head):
+            return None
+        raise
+    return data
+
+def _scan(root):
+    """Recursively yield non-ignored file entries under root using os.scandir."""
+    try:
+        with os.scandir(root) as it:
+            # Sort once per directory so the document order is deterministic
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as e:
+        # Skip unreadable or vanished directories, as os.walk did
+        print(f"Error processing {root}: {str(e)}")
+        return
+    for entry in entries:
+        # Ancestors are already filtered, so only the entry name needs checking
+        if should_ignore(entry.name):
+            continue
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            is_file = not is_dir and entry.is_file()
+        except OSError as e:
+            print(f"Error processing {entry.path}: {str(e)}")
+            continue
+        if is_dir:
+            yield from _scan(entry.path)
+        elif is_file:
+            yield entry
 
-def is_binary(file_path):
-    """Check if a file is binary."""
+def _read_entry(file_path):
+    """Read a file for the worker pool, returning (content, error)."""
     try:
-        with open(file_path, 'tr') as check_file:
-            check_file.read(1024)
-            return False
-    except UnicodeDecodeError:
-        return True
+        return read_utf8(file_path), None
+    except Exception as e:
+        return None, e
+
+def _read_ahead(executor, paths, depth):
+    """Yield (path, (content, error)) in order, keeping up to depth reads in flight."""
+    pending = deque()
+    for path in paths:
+        pending.append((path, executor.submit(_read_entry, path)))
+        if len(pending) >= depth:
+            path, future = pending.popleft()
+            yield path, future.result()
+    while pending:
+        path, future = pending.popleft()
+        yield path, future.result()
 
 def generate_context_document():
     """Generate a context document from all relevant files in the repository."""
     output_filename = f'context_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.txt'
     
-    with open(output_filename, 'w', encoding='utf-8') as output_file:
+    with open(output_filename, 'wb', buffering=1 << 20) as output_file:
         # Write header
-        output_file.write(f"Repository Context Document\n")
-        output_file.write(f"Generated on: {datetime.datetime.now()}\n")
-        output_file.write("=" * 80 + "\n\n")
+        output_file.write(''.join([
+            "Repository Context Document\n",
+            f"Generated on: {datetime.datetime.now()}\n",
+            "=" * 80 + "\n\n",
+        ]).encode('utf-8'))
 
-        # Walk through repository
-        for root, dirs, files in os.walk('.'):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if not should_ignore(os.path.join(root, d))]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                
-                # Skip ignored files
-                if should_ignore(file_path):
+        # Walk through repository, reading upcoming files in the background
+        paths = (entry.path for entry in _scan('.'))
+        max_workers = min(READ_AHEAD, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Results come back in walk order while later reads overlap the writes
+            for file_path, (content, error) in _read_ahead(executor, paths, READ_AHEAD):
+                if error is not None:
+                    print(f"Error processing {file_path}: {str(error)}")
                     continue
-                
+
                 # Skip binary files
-                if is_binary(file_path):
+                if content is None:
                     continue
-                
+
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                        # Write file header
-                        output_file.write(f"File: {file_path}\n")
-                        output_file.write("-" * 80 + "\n")
-                        
-                        # Write file content
-                        output_file.write(content)
-                        output_file.write("\n\n")
-                        output_file.write("=" * 80 + "\n\n")
+                    # Write file header, content and footer in a single call
+                    output_file.write(b''.join([
+                        # fsencode keeps non-UTF-8 names as their original bytes
+                        b"File: " + os.fsencode(file_path) + b"\n",
+                        _HEADER_RULE,
+                        content,
+                        _FOOTER,
+                    ]))
                 except Exception as e:
                     print(f"Error processing {file_path}: {str(e)}")
 